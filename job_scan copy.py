@@ -2,11 +2,17 @@ import time
 import random
 import pandas as pd
 import logging
+import csv
+import functools
+import hashlib
+import html
+import json
 import os
 import re
 import requests
+import sqlite3
 import concurrent.futures
-from bs4 import BeautifulSoup
+from lxml import html as lxml_html
 
 # Check for torch availability for the summarizer
 try:
@@ -24,7 +30,6 @@ from selenium.common.exceptions import (
     TimeoutException, NoSuchElementException,
     ElementClickInterceptedException, StaleElementReferenceException
 )
-from webdriver_manager.chrome import ChromeDriverManager
 
 
 # ---------- CONFIG ----------
@@ -32,8 +37,22 @@ KEYWORDS = ["data scientist", "data analyst"]
 LOCATION = "Toronto, ON"
 RADIUS = 50
 OUTPUT_FILE = "simplyhired_final_cleaned.csv"
+SEEN_DB_FILE = "seen.sqlite"    # persistent index of already-scraped URLs
 MAX_JOBS_TO_SCRAPE = 500
 MAX_PAGES_PER_KEYWORD = 18
+SIMPLYHIRED_WORKERS = 4         # parallel Chrome workers (capped at len(KEYWORDS))
+SIMPLYHIRED_USE_HTTP = False    # experimental: plain requests + JSON-LD, no Chrome at all
+SIMPLYHIRED_HTTP_WORKERS = 8    # detail-page fetch threads in HTTP mode (network-bound)
+VERIFY_WORKERS = 16             # concurrent URL checks in verify_and_clean_data
+HEADLESS = True                 # headless SimplyHired workers (LinkedIn always opens a window for login)
+CHROME_PROFILE_DIR = ".chrome-profile"  # persistent profile root; keeps cookies/cache across runs
+
+# Summarizer: flan-t5-base is ~3x fewer FLOPs than -large and near-identical
+# on the narrow "extract tech stack + duties + salary" prompt
+SUMMARIZER_MODEL = "google/flan-t5-base"
+SUMMARIZER_USE_ONNX = False     # serve the summarizer via optimum/onnxruntime if installed
+SUMMARIZER_LOAD_IN_8BIT = False # bitsandbytes int8 weights on CUDA (quarter the VRAM)
+SUMMARY_CACHE_FILE = "summaries.sqlite"  # description-hash -> summary, survives reruns
 
 # Salary reliability controls
 SALARY_RETRIES = 3
@@ -41,30 +60,110 @@ SALARY_WAIT_SECONDS = 8
 OPEN_URL_FALLBACK = True
 
 # --- ADVANCED KEYWORD LOGIC ---
-BAD_KEYWORDS = [
+# Tuples, not lists: these are scan constants, and the historically common
+# hits ("manager", "sales", "intern") sit up front so the regex fallback's
+# alternation fails fast on typical titles.
+BAD_KEYWORDS = (
     "intern", "co-op", "coop", "student", "summer", "placement",
     "manager", "director", "head of", "vp", "president", "chief", "principal", "lead",
     "sales", "customer service", "technician", "support", "clerk", "admin",
     "marketing", "account executive", "driver", "warehouse", "nurse", "bilingual",
     "business analyst", "business systems analyst", "business system analyst", "financial analyst"
-]
+)
 
-STRONG_KEYWORDS = [
+STRONG_KEYWORDS = (
     "data scientist", "data engineer", "machine learning", "ai engineer", "analytics",
     "computer vision", "nlp", "business intelligence", "deep learning",
     "data analyst", "quantitative researcher", "statistical modeling", "statistician"
-]
+)
 
-AMBIGUOUS_KEYWORDS = [
+AMBIGUOUS_KEYWORDS = (
     "analyst", "insights", "consultant", "scientist", "researcher",
     "strategist", "specialist", "associate"
-]
+)
 
-TECH_KEYWORDS = [
+TECH_KEYWORDS = (
     "sql", "python", " r ", "r-programming", "tableau", "power bi", "powerbi",
     "aws", "azure", "gcp", "snowflake", "etl", "pipeline", "modeling", "models",
     "machine learning", "statistical", "looker", "bigquery", "spark", "hadoop"
-]
+)
+
+# Check for pyahocorasick for fast keyword scans
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+# Build one tagged Aho-Corasick automaton over all keyword lists so each
+# title/description is scanned once (O(len(text))) instead of once per
+# keyword. A keyword can live in several lists ("machine learning" is both
+# STRONG and TECH), so values are frozensets of tags.
+_KEYWORD_TAGS = {}
+for _tag, _kws in (("BAD", BAD_KEYWORDS), ("STRONG", STRONG_KEYWORDS),
+                   ("AMBIG", AMBIGUOUS_KEYWORDS), ("TECH", TECH_KEYWORDS)):
+    for _kw in _kws:
+        _KEYWORD_TAGS.setdefault(_kw, set()).add(_tag)
+
+if ahocorasick:
+    _KEYWORD_AC = ahocorasick.Automaton()
+    for _kw, _tags in _KEYWORD_TAGS.items():
+        _KEYWORD_AC.add_word(_kw, frozenset(_tags))
+    _KEYWORD_AC.make_automaton()
+else:
+    _KEYWORD_AC = None
+
+# Dependency-free fallback: one fused alternation regex per category, compiled
+# once, so a miss still costs a single C-level scan instead of K substring
+# searches per list. Longest keywords first so e.g. "business systems analyst"
+# is matched in preference to its "business analyst" prefix. BAD keywords are
+# anchored at word boundaries: they are short role words ("lead", "vp") that
+# would otherwise fire inside harmless words ("team leader"), whereas the
+# topical lists want substring hits ("analytics" inside "analytics engineering").
+def _fused_regex(kws, boundaries=False):
+    alt = "|".join(re.escape(k) for k in sorted(kws, key=len, reverse=True))
+    return re.compile(rf"\b(?:{alt})\b" if boundaries else alt)
+
+
+_KEYWORD_RES = {
+    "BAD": _fused_regex(BAD_KEYWORDS, boundaries=True),
+    "STRONG": _fused_regex(STRONG_KEYWORDS),
+    "AMBIG": _fused_regex(AMBIGUOUS_KEYWORDS),
+    "TECH": _fused_regex(TECH_KEYWORDS),
+}
+
+
+def keyword_categories(text_lower):
+    """
+    Returns the set of keyword category tags ('BAD'/'STRONG'/'AMBIG'/'TECH')
+    found in an already-lowercased string.
+    """
+    if _KEYWORD_AC is not None:
+        cats = set()
+        for _, tags in _KEYWORD_AC.iter(text_lower):
+            cats |= tags
+        # Automaton hits are substring hits; BAD must survive the stricter
+        # word-boundary check before it can veto a title
+        if "BAD" in cats and not _KEYWORD_RES["BAD"].search(text_lower):
+            cats.discard("BAD")
+        return cats
+    return {tag for tag, rx in _KEYWORD_RES.items() if rx.search(text_lower)}
+
+
+def has_category(text_lower, tag):
+    """
+    True if any keyword of the given category matches. Short-circuits on the
+    first hit, which matters for the TECH scan over multi-KB descriptions.
+    BAD matches only at word boundaries; see _KEYWORD_RES.
+    """
+    if tag == "BAD":
+        return _KEYWORD_RES["BAD"].search(text_lower) is not None
+    if _KEYWORD_AC is not None:
+        for _, tags in _KEYWORD_AC.iter(text_lower):
+            if tag in tags:
+                return True
+        return False
+    return _KEYWORD_RES[tag].search(text_lower) is not None
+
 
 # Output schema (exact column order you want)
 OUTPUT_COLUMNS = ["title", "url", "company", "description", "salary", "qualifications", "scraped_at"]
@@ -72,16 +171,26 @@ OUTPUT_COLUMNS = ["title", "url", "company", "description", "salary", "qualifica
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(message)s')
 logger = logging.getLogger(__name__)
 
-SALARY_RE = re.compile(
-    r"""
-    (?:CA?\$|C\$|\$)\s*[\d]{1,3}(?:[,\s]\d{3})*(?:\.\d+)?\s*[kK]?
-    (?:\s*(?:-|–|—|to)\s*
-        (?:CA?\$|C\$|\$)?\s*[\d]{1,3}(?:[,\s]\d{3})*(?:\.\d+)?\s*[kK]?
+# \xa0 is listed alongside \s because page text separates figures with
+# non-breaking spaces, and re.ASCII (below) narrows \s to ASCII whitespace.
+_SALARY_PATTERN = r"""
+    (?:CA?\$|C\$|\$)[\s\xa0]*[\d]{1,3}(?:[,\s\xa0]\d{3})*(?:\.\d+)?[\s\xa0]*[kK]?
+    (?:[\s\xa0]*(?:-|–|—|to)[\s\xa0]*
+        (?:CA?\$|C\$|\$)?[\s\xa0]*[\d]{1,3}(?:[,\s\xa0]\d{3})*(?:\.\d+)?[\s\xa0]*[kK]?
     )?
-    (?:\s*(?:/|per\s*)?(?:hour|hr|year|yr|month|mo|week|wk|day|annum))?
-    """,
-    re.IGNORECASE | re.VERBOSE
-)
+    (?:[\s\xa0]*(?:/|per[\s\xa0]*)?(?:hour|hr|year|yr|month|mo|week|wk|day|annum))?
+"""
+
+# Prefer google-re2 when available: it compiles to a linear-time DFA, so
+# searching a whole job-pane text can never backtrack pathologically the
+# way the nested optional groups above can with stdlib re.
+try:
+    import re2 as _re2
+    SALARY_RE = _re2.compile(_SALARY_PATTERN, _re2.IGNORECASE | _re2.VERBOSE)
+except Exception:
+    # re.ASCII keeps \d, \s and case-folding on the fast ASCII tables;
+    # nothing in salary text needs the Unicode variants
+    SALARY_RE = re.compile(_SALARY_PATTERN, re.IGNORECASE | re.VERBOSE | re.ASCII)
 
 # --- STRICT FIELD VALIDATION ---
 REQUIRE_COMPANY = True          # hard stop for saving/buffering
@@ -98,32 +207,26 @@ def is_missing(s):
     return (s == "" or s.lower() in {"n/a", "na", "none", "null"})
 
 
+# Backreference match for a title that is exactly two copies of itself,
+# with or without a separating space - compiled once, no list allocations.
+_DOUBLED_TITLE_RE = re.compile(r"^(.+?)\s*\1$")
+
+
+@functools.lru_cache(maxsize=4096)
 def fix_doubled_title(text):
     """
-    Fixes titles that are repeated like 'Data Scientist Data Scientist'
-    or 'Sr. Statistician Sr. Statistician'.
+    Fixes titles that are repeated like 'Data Scientist Data Scientist',
+    'Sr. Statistician Sr. Statistician' or 'Data ScientistData Scientist'.
+    Cached: the same titles recur across cards, pages and keywords.
     """
     if not text:
         return ""
-    
+
     # Normalize spaces
     text = " ".join(text.split())
-    
-    # 1. Check for word-based duplication (e.g. "Data Scientist Data Scientist")
-    parts = text.split()
-    if len(parts) >= 2 and len(parts) % 2 == 0:
-        half = len(parts) // 2
-        # If the first half of words equals the second half
-        if parts[:half] == parts[half:]:
-            return " ".join(parts[:half])
-
-    # 2. Check for concatenated duplication (e.g. "Data ScientistData Scientist")
-    if len(text) > 4 and len(text) % 2 == 0:
-        mid = len(text) // 2
-        if text[:mid] == text[mid:]:
-            return text[:mid]
-            
-    return text
+
+    m = _DOUBLED_TITLE_RE.match(text)
+    return m.group(1) if m else text
 
 
 def dbg(status, title=None, company=None, salary=None, url=None, reason=None):
@@ -137,7 +240,17 @@ def dbg(status, title=None, company=None, salary=None, url=None, reason=None):
     print(msg)
 
 
-def make_driver():
+def make_driver(headless=None, profile=None):
+    """
+    Builds a Chrome driver. The scraper never looks at pixels, so images /
+    stylesheets / notifications are blocked to cut page weight, and workers
+    run headless by default (pass headless=False for the LinkedIn login).
+    `profile` names the persistent profile subdir; concurrent drivers must
+    pass distinct names since Chrome locks a profile exclusively.
+    """
+    if headless is None:
+        headless = HEADLESS
+
     opts = Options()
     opts.add_argument("--window-size=1600,1000")
     opts.add_argument("--disable-blink-features=AutomationControlled")
@@ -146,44 +259,177 @@ def make_driver():
         "AppleWebKit/537.36 (KHTML, like Gecko) "
         "Chrome/121.0.0.0 Safari/537.36"
     )
-    service = Service(ChromeDriverManager().install())
-    driver = webdriver.Chrome(service=service, options=opts)
+    if headless:
+        opts.add_argument("--headless=new")
+    opts.add_argument("--disable-gpu")
+    opts.add_argument("--disable-dev-shm-usage")
+    opts.add_argument("--no-sandbox")
+    opts.add_argument("--blink-settings=imagesEnabled=false")
+    # Return from driver.get when the DOM is interactive; the extractors
+    # wait on their own elements, not on subresources finishing.
+    opts.page_load_strategy = "eager"
+    # Persistent profile so the HTTP cache, JS bundles and (for the headed
+    # LinkedIn session) auth cookies survive across runs. Callers running
+    # drivers concurrently pass a stable name per worker so caches are
+    # actually reused run over run instead of piling up orphaned dirs.
+    if profile is None:
+        profile = "main" if not headless else "worker"
+    opts.add_argument(f"--user-data-dir={os.path.abspath(os.path.join(CHROME_PROFILE_DIR, profile))}")
+    opts.add_experimental_option("prefs", {
+        "profile.managed_default_content_settings.images": 2,
+        "profile.default_content_setting_values.notifications": 2,
+        "profile.managed_default_content_settings.stylesheets": 2,
+    })
+    # Resolve chromedriver via CHROMEDRIVER_PATH if pinned, otherwise let
+    # Selenium Manager (built into Selenium 4.11+) find and cache it -
+    # no per-spawn network check like webdriver_manager did.
+    driver_path = os.environ.get("CHROMEDRIVER_PATH")
+    if driver_path:
+        driver = webdriver.Chrome(service=Service(driver_path), options=opts)
+    else:
+        driver = webdriver.Chrome(options=opts)
     driver.set_page_load_timeout(30)
+
+    # Drop tracker/ad/media requests at the network layer via CDP - they
+    # account for most of the request count on the job boards and only
+    # delay the elements we actually wait on.
+    try:
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": [
+            "*google-analytics*", "*googletagmanager*", "*doubleclick*",
+            "*facebook.net*", "*hotjar*", "*segment.io*", "*segment.com*",
+            "*.png", "*.jpg", "*.jpeg", "*.gif", "*.svg", "*.webp",
+            "*.woff*", "*.ttf", "*.mp4",
+        ]})
+    except Exception:
+        pass  # CDP unavailable (e.g. non-Chrome/remote session)
+
     return driver
 
 
+def navigate_warm(driver, url):
+    """
+    Same-site navigation via window.location instead of driver.get:
+    keeps the session's cached resources and service workers warm, so
+    subsequent keyword searches skip re-fetching the app shell.
+    """
+    try:
+        driver.execute_script("window.location.href = arguments[0];", url)
+    except Exception:
+        driver.get(url)
+
+
+_salary_search = SALARY_RE.search  # bound once; skips the attribute lookup per call
+
+
 def clean_salary_text(text: str) -> str:
     if not text:
         return "N/A"
-    t = " ".join(text.split())
-    m = SALARY_RE.search(t)
-    return m.group(0).strip() if m else "N/A"
+    # The pattern is \s-tolerant, so scan the raw pane text directly and
+    # only normalize whitespace inside the (tiny) match, instead of
+    # rebuilding the entire multi-KB string just to collapse spaces.
+    m = _salary_search(text)
+    return " ".join(m.group(0).split()) if m else "N/A"
 
 
 # ----------------------------
 # SimplyHired Parser
 # ----------------------------
-def parse_job_data(driver, card, prev_desc):
-    data = {}
 
-    # Parse card HTML for TRUSTED data (Title, URL, Company)
+# Single-round-trip extractors. Each Selenium find_element/.text call is a
+# separate JSON-over-HTTP command to chromedriver; batching the lookups into
+# one execute_script keeps the per-card cost at one round trip.
+_CARD_EXTRACT_JS = """
+const card = arguments[0];
+const a = card.querySelector("a[class*='jobTitle']") || card.querySelector("a");
+const co = card.querySelector("span[data-testid='companyName']");
+return {
+    title: a ? a.innerText.trim() : "",
+    href: a ? (a.getAttribute("href") || "") : "",
+    company: co ? co.innerText.trim() : ""
+};
+"""
+
+_PANE_EXTRACT_JS = """
+const q = s => document.querySelector(s);
+const desc = q("div[data-testid='viewJobBodyJobFullDescriptionContent']");
+const sal = q("[data-testid='viewJobBodyJobCompensation']");
+const body = q("[data-testid='viewJobBodyContainer']");
+return {
+    desc: desc ? desc.innerText : "",
+    salary: sal ? sal.innerText : "",
+    body: body ? body.innerText : "",
+    quals: [...new Set(Array.from(document.querySelectorAll("span[data-testid='viewJobQualificationItem']"))
+                .map(e => e.innerText.trim()).filter(Boolean))]
+};
+"""
+
+_PANE_SYNC_JS = """
+const q = s => document.querySelector(s);
+const co = q("span[data-testid='viewJobCompanyName']") || q("[data-testid='viewJobCompanyName']");
+const ti = q("h2[data-testid='viewJobBodyJobTitle']");
+return {
+    company: co ? co.innerText.trim() : "",
+    title: ti ? ti.innerText.trim() : ""
+};
+"""
+
+# Poll-tick probe: just the description text, so waiting for the pane to
+# refresh doesn't serialize the full body/quals payload on every tick.
+_DESC_ONLY_JS = """
+const d = document.querySelector("div[data-testid='viewJobBodyJobFullDescriptionContent']");
+return d ? d.innerText : "";
+"""
+
+
+def _extract_card_js(driver, card):
+    """Pull title/href/company off a result card in one WebDriver command."""
+    return driver.execute_script(_CARD_EXTRACT_JS, card)
+
+
+# Same extraction as an expression for CDP Runtime.evaluate
+_PANE_EXTRACT_EXPR = "(() => {" + _PANE_EXTRACT_JS + "})()"
+
+
+def _extract_pane_js(driver):
+    """
+    Pull description/salary/qualifications from the right pane in one command.
+    Prefers CDP Runtime.evaluate with returnByValue, which skips the WebDriver
+    wire protocol's element-text machinery; falls back to execute_script.
+    """
     try:
-        card_html = card.get_attribute("outerHTML")
-        soup = BeautifulSoup(card_html, "lxml")
+        res = driver.execute_cdp_cmd("Runtime.evaluate", {
+            "expression": _PANE_EXTRACT_EXPR,
+            "returnByValue": True,
+        })
+        value = res.get("result", {}).get("value")
+        if value is not None:
+            return value
+    except Exception:
+        pass
+    return driver.execute_script(_PANE_EXTRACT_JS)
+
+
+def parse_job_data(driver, card, prev_desc, card_meta=None):
+    data = {}
 
-        title_tag = (soup.find("a", class_=lambda x: x and "jobTitle" in x) or soup.find("a"))
-        title = fix_doubled_title(title_tag.get_text(strip=True)) if title_tag else ""
+    # Card data (Title, URL, Company): reuse what the page-level triage
+    # already extracted when available, else pull it in one JS call.
+    if card_meta:
+        data.update({"title": card_meta["title"], "company": card_meta["company"], "url": card_meta["url"]})
+    else:
+        try:
+            card_info = _extract_card_js(driver, card)
 
-        href = title_tag.get("href", "") if title_tag else ""
-        url = ("https://www.simplyhired.ca" + href.split("?")[0]) if href and not href.startswith("http") else href
+            title = fix_doubled_title(card_info["title"])
 
-        company_tag = soup.find("span", attrs={"data-testid": "companyName"})
-        company = company_tag.get_text(strip=True) if company_tag else ""
+            href = card_info["href"]
+            url = ("https://www.simplyhired.ca" + href.split("?")[0]) if href and not href.startswith("http") else href
 
-        data.update({"title": title, "company": company, "url": url})
-    except Exception as e:
-        dbg("FAIL_CARD_PARSE", reason=f"{type(e).__name__}")
-        return None
+            data.update({"title": title, "company": card_info["company"], "url": url})
+        except Exception as e:
+            dbg("FAIL_CARD_PARSE", reason=f"{type(e).__name__}")
+            return None
 
     if is_missing(data["title"]) or is_missing(data["url"]):
         dbg("SKIP", title=data.get("title"), company=data.get("company"), url=data.get("url"),
@@ -200,7 +446,6 @@ def parse_job_data(driver, card, prev_desc):
     # Click card to load right pane
     try:
         driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", card)
-        time.sleep(0.4)
         try:
             card.find_element(By.TAG_NAME, "a").click()
         except Exception:
@@ -211,79 +456,58 @@ def parse_job_data(driver, card, prev_desc):
         return None
 
     # --- SYNCHRONIZATION: Wait for Pane to Match Card ---
-    wait = WebDriverWait(driver, 10)
-    pane_matched = False
-    
-    # Selectors to find company/title in the Right Pane
-    pane_checks = [
-        ('span[data-testid="viewJobCompanyName"]', "company"),
-        ('[data-testid="viewJobCompanyName"]', "company"),
-        ('h2[data-testid="viewJobBodyJobTitle"]', "title"), # fallback
-    ]
-
-    for _ in range(15): # Try for ~3 seconds
-        for sel, type_ in pane_checks:
-            try:
-                el = driver.find_element(By.CSS_SELECTOR, sel)
-                txt = el.text.strip()
-                if not txt: continue
-                
-                # Loose matching to account for minor formatting diffs
-                if type_ == "company":
-                    # Check if card company is inside pane text or vice versa
-                    if (data["company"].lower() in txt.lower()) or (txt.lower() in data["company"].lower()):
-                        pane_matched = True
-                        break
-                elif type_ == "title":
-                    if (data["title"][:10].lower() in txt.lower()):
-                        pane_matched = True
-                        break
-            except Exception:
-                pass
-        
-        if pane_matched:
-            break
-        time.sleep(0.2)
+    def _pane_matches(d):
+        # One JS hop per poll tick instead of a find_element per selector
+        ids = d.execute_script(_PANE_SYNC_JS)
+        # Loose matching to account for minor formatting diffs:
+        # card company inside pane text or vice versa
+        co = ids["company"].lower()
+        if co and (data["company"].lower() in co or co in data["company"].lower()):
+            return True
+        ti = ids["title"].lower()  # title fallback
+        return bool(ti and data["title"][:10].lower() in ti)
 
-    if not pane_matched:
-        dbg("SKIP_SYNC_FAIL", title=data["title"], company=data["company"], 
+    try:
+        # Returns the instant the pane catches up instead of sleeping in
+        # fixed 0.2s steps; timeout budget matches the old 15-iteration loop.
+        WebDriverWait(driver, 3, poll_frequency=0.2).until(_pane_matches)
+    except TimeoutException:
+        dbg("SKIP_SYNC_FAIL", title=data["title"], company=data["company"],
             reason="Right pane did not update to match card details")
         return None
 
-    # Description - STRICT PREV_DESC CHECK
-    desc_text = "N/A"
-    
-    # We will poll the description element.
-    # It MUST be different from prev_desc to be accepted (unless prev_desc was N/A).
-    start_desc_time = time.time()
-    while (time.time() - start_desc_time) < 6.0:
-        try:
-            elem = driver.find_element(By.CSS_SELECTOR, 'div[data-testid="viewJobBodyJobFullDescriptionContent"]')
-            txt = elem.text.strip()
-            
-            # If we have text, and it is NOT the same as the previous job's description
-            if txt and (txt != prev_desc or prev_desc == ""):
-                desc_text = txt
-                break
-                
-            # If prev_desc is not empty and txt IS equal to prev_desc, it means stale data.
-            # We continue looping/waiting for it to change.
-        except Exception:
-            pass
-        time.sleep(0.5)
-
-    data["description"] = desc_text
+    # The description MUST be different from prev_desc to be accepted
+    # (unless prev_desc was empty) - if it still equals prev_desc the pane
+    # holds stale data from the previous card and we keep waiting. Polling
+    # reads only the description; the full salary/quals payload is pulled
+    # exactly once after the refresh is confirmed.
+    def _desc_refreshed(d):
+        txt = d.execute_script(_DESC_ONLY_JS).strip()
+        if txt and (txt != prev_desc or prev_desc == ""):
+            return txt
+        return False
 
-    # Salary
-    salary = "N/A"
     try:
-        sal_box = driver.find_element(By.CSS_SELECTOR, '[data-testid="viewJobBodyJobCompensation"]')
-        salary = clean_salary_text(sal_box.text)
+        desc_text = WebDriverWait(driver, 6, poll_frequency=0.25).until(_desc_refreshed)
+        pane = _extract_pane_js(driver)
     except Exception:
+        # Best effort: salary/qualifications may still be readable
         try:
-            salary = clean_salary_text(driver.find_element(By.CSS_SELECTOR, '[data-testid="viewJobBodyContainer"]').text)
+            pane = _extract_pane_js(driver)
         except Exception:
-            salary = "N/A"
+            pane = None
+        desc_text = "N/A"
+
+    data["description"] = desc_text
+
+    # Salary: the description is already in hand, so regex-scan it first;
+    # the compensation chip and the full body text are fallbacks for the
+    # minority of postings that only state pay outside the description.
+    salary = clean_salary_text(desc_text) if desc_text != "N/A" else "N/A"
+    if salary == "N/A" and pane and pane["salary"]:
+        salary = clean_salary_text(pane["salary"])
+    if salary == "N/A" and pane and pane["body"]:
+        salary = clean_salary_text(pane["body"])
     data["salary"] = salary
 
     if REQUIRE_SALARY and is_missing(data["salary"]):
@@ -292,11 +516,7 @@ def parse_job_data(driver, card, prev_desc):
         return None
 
     # Qualifications
-    try:
-        quals = driver.find_elements(By.CSS_SELECTOR, 'span[data-testid="viewJobQualificationItem"]')
-        data["qualifications"] = "; ".join(q.text.strip() for q in quals if q.text and q.text.strip()) or "N/A"
-    except Exception:
-        data["qualifications"] = "N/A"
+    data["qualifications"] = "; ".join(pane["quals"]) if pane and pane["quals"] else "N/A"
 
     data["scraped_at"] = time.strftime("%Y-%m-%d %H:%M:%S")
 
@@ -312,60 +532,197 @@ def summarize_new_jobs_buffer(new_jobs_list):
         return pd.DataFrame()
 
     print(f"\n--- Summarizing {len(new_jobs_list)} NEW jobs ---")
+    df = pd.DataFrame(new_jobs_list)
+
+    # Descriptions repeat across reruns (reposted jobs, crash-restart runs),
+    # so summaries are cached by content hash and model work only happens for
+    # texts we have never seen before.
+    cache_db = sqlite3.connect(SUMMARY_CACHE_FILE)
+    cache_db.execute("CREATE TABLE IF NOT EXISTS summaries (hash TEXT PRIMARY KEY, summary TEXT)")
+
+    def _desc_hash(text):
+        return hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+
+    chunk_size = 450
+    batch_size = 16
+
+    # Split every long description into chunks up front so the model sees
+    # one big batched workload instead of a generate() call per chunk.
+    # Short/missing/cached descriptions never reach the model.
+    all_chunks = []
+    spans = {}   # df row index -> slice of all_chunks belonging to it
+    hashes = {}  # df row index -> content hash, for the cache write-back
+    for idx, text in df["description"].items():
+        if not text or text == "N/A" or len(str(text).split()) < 80:
+            continue
+        text = str(text)
+        h = _desc_hash(text)
+        cached = cache_db.execute("SELECT summary FROM summaries WHERE hash = ?", (h,)).fetchone()
+        if cached:
+            df.loc[idx, "description"] = cached[0]
+            continue
+        words = text.split()
+        chunks = [" ".join(words[i:i + chunk_size]) for i in range(0, len(words), chunk_size)]
+        spans[idx] = (len(all_chunks), len(all_chunks) + len(chunks))
+        hashes[idx] = h
+        all_chunks.extend(chunks)
+
+    if not all_chunks:
+        cache_db.close()
+        print("All descriptions short or cached - skipping model load.")
+        sal = df["salary"].astype(str)
+        df["salary"] = sal.mask(df["salary"].isna() | sal.str.fullmatch(r"\s*"), "N/A")
+        return df
+
     try:
         from transformers import AutoTokenizer, AutoModelForSeq2SeqLM
     except ImportError:
         print("Transformers not installed. Skipping summarization.")
-        return pd.DataFrame(new_jobs_list)
+        cache_db.close()
+        return df
 
     device = "cuda" if torch and torch.cuda.is_available() else "cpu"
     print(f"Running on device: {device.upper()}")
 
-    tokenizer = AutoTokenizer.from_pretrained("google/flan-t5-large")
-    model = AutoModelForSeq2SeqLM.from_pretrained("google/flan-t5-large").to(device)
-
-    df = pd.DataFrame(new_jobs_list)
+    tokenizer = AutoTokenizer.from_pretrained(SUMMARIZER_MODEL)
 
-    def process_text(text):
-        if not text or text == "N/A" or len(str(text).split()) < 80:
-            return text
+    # Full fp32 weights are overkill for generation-only use: halve them on
+    # GPU (bf16 where tensor cores support it, else fp16) and dynamically
+    # quantize the linear layers to int8 on CPU.
+    model = None
+    if SUMMARIZER_USE_ONNX:
+        # Optional ONNX Runtime backend (fused attention kernels); exports
+        # the model on first use and caches it under the HF cache dir.
         try:
-            words = str(text).split()
-            chunk_size = 450
-            chunks = [" ".join(words[i:i + chunk_size]) for i in range(0, len(words), chunk_size)]
-            intermediate = []
-            for chunk in chunks:
-                prompt = f"Summarize technical skills and duties in this job text, obtain salary / salary range, if available:\n\n{chunk}"
-                inputs = tokenizer(prompt, return_tensors="pt", truncation=True, max_length=1024).to(device)
-                outputs = model.generate(inputs["input_ids"], max_length=150)
-                intermediate.append(tokenizer.decode(outputs[0], skip_special_tokens=True))
-
-            final_prompt = "Write a professional paragraph job summary listing tech stack and responsibilities, obtain salary / salary range, if available:\n\n" + " ".join(intermediate)
-            inputs = tokenizer(final_prompt, return_tensors="pt", truncation=True, max_length=1024).to(device)
-            outputs = model.generate(inputs["input_ids"], max_length=300, min_length=100, num_beams=4)
-            return tokenizer.decode(outputs[0], skip_special_tokens=True)
-        except Exception:
-            return text
+            from optimum.onnxruntime import ORTModelForSeq2SeqLM
+            provider = "CUDAExecutionProvider" if device == "cuda" else "CPUExecutionProvider"
+            model = ORTModelForSeq2SeqLM.from_pretrained(SUMMARIZER_MODEL, export=True, provider=provider)
+            print("Using ONNX Runtime summarizer backend.")
+        except Exception as e:
+            print(f"ONNX Runtime unavailable ({type(e).__name__}). Falling back to PyTorch.")
+
+    if model is None:
+        if device == "cuda":
+            # Let any residual fp32 matmuls use TF32 tensor cores
+            torch.backends.cuda.matmul.allow_tf32 = True
+            torch.set_float32_matmul_precision("high")
+            if SUMMARIZER_LOAD_IN_8BIT:
+                # Optional bitsandbytes int8 weights - quarter the VRAM of
+                # fp32, useful when the GPU is shared with the browser.
+                try:
+                    model = AutoModelForSeq2SeqLM.from_pretrained(
+                        SUMMARIZER_MODEL, load_in_8bit=True, device_map="auto")
+                except Exception as e:
+                    print(f"8-bit load unavailable ({type(e).__name__}). Using half precision.")
+            if model is None:
+                dtype = torch.bfloat16 if torch.cuda.is_bf16_supported() else torch.float16
+                model = AutoModelForSeq2SeqLM.from_pretrained(SUMMARIZER_MODEL, torch_dtype=dtype).to(device)
+                try:
+                    model = torch.compile(model, mode="reduce-overhead", fullgraph=False)
+                except Exception:
+                    pass  # torch.compile unsupported on this torch/platform
+        else:
+            model = AutoModelForSeq2SeqLM.from_pretrained(SUMMARIZER_MODEL)
+            try:
+                model = torch.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+            except Exception:
+                pass  # keep fp32 if the build lacks quantized kernels
+        model.eval()
+
+    chunk_prompt = "Summarize technical skills and duties in this job text, obtain salary / salary range, if available:\n\n"
+    final_prompt = "Write a professional paragraph job summary listing tech stack and responsibilities, obtain salary / salary range, if available:\n\n"
+
+    # The two prompt prefixes never change, so tokenize them exactly once
+    # instead of re-running SentencePiece on the same tokens for every chunk.
+    chunk_prefix_ids = tokenizer(chunk_prompt, add_special_tokens=False).input_ids
+    final_prefix_ids = tokenizer(final_prompt, add_special_tokens=False).input_ids
+
+    def generate_batched(prefix_ids, texts, **gen_kwargs):
+        # Batch similar-length inputs together so padding wastes as little
+        # compute as possible; results are restored to the caller's order.
+        order = sorted(range(len(texts)), key=lambda i: len(texts[i]))
+        decoded = [None] * len(texts)
+        for start in range(0, len(order), batch_size):
+            idx_batch = order[start:start + batch_size]
+            enc = tokenizer([texts[i] for i in idx_batch],
+                            truncation=True, max_length=1024 - len(prefix_ids))
+            features = [{"input_ids": prefix_ids + ids} for ids in enc["input_ids"]]
+            inputs = tokenizer.pad(features, return_tensors="pt").to(device)
+            outputs = model.generate(**inputs, **gen_kwargs)
+            for i, text in zip(idx_batch, tokenizer.batch_decode(outputs, skip_special_tokens=True)):
+                decoded[i] = text
+        return decoded
 
-    df["description"] = df["description"].apply(process_text)
-    df["salary"] = df["salary"].replace(r"^\s*$", "N/A", regex=True).fillna("N/A")
+    try:
+        with torch.inference_mode():
+            # Greedy decoding on the intermediate pass: beams fight batching
+            intermediate = generate_batched(chunk_prefix_ids, all_chunks, max_length=150, num_beams=1)
+            final_texts = [" ".join(intermediate[s:e]) for s, e in spans.values()]
+            finals = generate_batched(final_prefix_ids, final_texts, max_length=300, min_length=100, num_beams=4)
+        for idx, summary in zip(spans.keys(), finals):
+            df.loc[idx, "description"] = summary
+        with cache_db:
+            cache_db.executemany(
+                "INSERT OR IGNORE INTO summaries (hash, summary) VALUES (?, ?)",
+                [(hashes[idx], summary) for idx, summary in zip(spans.keys(), finals)])
+    except Exception as e:
+        print(f"Summarization failed, keeping raw descriptions: {e}")
+    cache_db.close()
+
+    # One vectorized pass: NaN or whitespace-only becomes "N/A".
+    # str.fullmatch tests in place instead of allocating a stripped copy
+    # of every cell the way .str.strip().eq("") does.
+    sal = df["salary"].astype(str)
+    df["salary"] = sal.mask(df["salary"].isna() | sal.str.fullmatch(r"\s*"), "N/A")
     return df
 
 
 # ----------------------------
 # LinkedIn helpers (AUTH UI)
 # ----------------------------
+# Prefer selectolax's Lexbor parser when installed - a C HTML engine that
+# benchmarks well ahead of lxml on small-fragment parse+select workloads.
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:
+    LexborHTMLParser = None
+
+_LINKEDIN_TITLE_SELECTORS = (
+    "a.job-card-list__title",
+    "a.job-card-container__link",
+    "a.job-card-container__link span[aria-hidden='true']",
+)
+
+# XPath equivalents of the CSS selectors, compiled once, for the lxml
+# fallback. Going through lxml directly skips the BeautifulSoup
+# tree-wrapping layer, which is pure Python overhead on a fragment this
+# small that gets parsed per card.
+_LINKEDIN_TITLE_XPATHS = tuple(lxml_html.etree.XPath(xp) for xp in (
+    './/a[contains(concat(" ", normalize-space(@class), " "), " job-card-list__title ")]',
+    './/a[contains(concat(" ", normalize-space(@class), " "), " job-card-container__link ")]',
+    './/a[contains(concat(" ", normalize-space(@class), " "), " job-card-container__link ")]'
+    '//span[@aria-hidden="true"]',
+))
+
+
 def linkedin_title_from_card_html(card_html: str) -> str:
-    soup = BeautifulSoup(card_html, "lxml")
-    selectors = [
-        "a.job-card-list__title",
-        "a.job-card-container__link",
-        "a.job-card-container__link span[aria-hidden='true']",
-    ]
-    for sel in selectors:
-        node = soup.select_one(sel)
-        if node:
-            txt = node.get_text(" ", strip=True)
+    if LexborHTMLParser is not None:
+        tree = LexborHTMLParser(card_html)
+        for sel in _LINKEDIN_TITLE_SELECTORS:
+            node = tree.css_first(sel)
+            if node:
+                txt = node.text(strip=True)
+                if txt:
+                    return fix_doubled_title(txt)
+        return ""
+    try:
+        tree = lxml_html.fromstring(card_html)
+    except Exception:
+        return ""
+    for xpath in _LINKEDIN_TITLE_XPATHS:
+        nodes = xpath(tree)
+        if nodes:
+            txt = " ".join(nodes[0].text_content().split())
             if txt:
                 return fix_doubled_title(txt)
     return ""
@@ -387,30 +744,60 @@ def linkedin_url_from_card(card) -> str:
         return ""
 
 
+# Walks a selector list inside the page and returns the first non-empty
+# innerText: one WebDriver round trip instead of one find_element per
+# selector. Selector lists are hoisted module constants so they aren't
+# rebuilt on every card/poll.
+_FIND_FIRST_JS = """
+for (const s of arguments[0]) {
+    const e = document.querySelector(s);
+    if (e && e.innerText.trim()) return e.innerText.trim();
+}
+return "";
+"""
+
+_LI_PANE_TITLE_SELECTORS = (
+    ".job-details-jobs-unified-top-card__job-title",
+    ".jobs-unified-top-card__job-title",
+    "h2.t-24",  # Common LinkedIn header class
+    "[data-test-job-details-header-title]",
+)
+
+# Installed once per results page: flips a flag whenever the detail pane's
+# description subtree mutates, so the description wait polls a boolean
+# instead of serializing the full pane text every tick. Falls back to
+# observing <body> if the pane container isn't in the DOM yet.
+_DESC_OBSERVER_JS = """
+window.__descChanged = false;
+if (window.__descObs) { window.__descObs.disconnect(); }
+const target = document.querySelector('.jobs-search__job-details') ||
+               document.querySelector('#job-details') ||
+               document.body;
+window.__descObs = new MutationObserver(() => { window.__descChanged = true; });
+window.__descObs.observe(target, {childList: true, subtree: true, characterData: true});
+"""
+
+_LI_COMPANY_SELECTORS = (
+    ".job-details-jobs-unified-top-card__company-name a",
+    ".job-details-jobs-unified-top-card__company-name",
+    ".jobs-unified-top-card__company-name a",
+    ".jobs-unified-top-card__company-name",
+    'a[data-tracking-control-name="public_jobs_topcard-org-name"]',
+    'a[data-control-name="company_link"]',
+)
+
+
 def linkedin_company_from_pane(driver) -> str:
-    sels = [
-        ".job-details-jobs-unified-top-card__company-name a",
-        ".job-details-jobs-unified-top-card__company-name",
-        ".jobs-unified-top-card__company-name a",
-        ".jobs-unified-top-card__company-name",
-        'a[data-tracking-control-name="public_jobs_topcard-org-name"]',
-        'a[data-control-name="company_link"]',
-    ]
-    for sel in sels:
-        try:
-            el = driver.find_element(By.CSS_SELECTOR, sel)
-            txt = el.text.strip()
-            if txt:
-                return txt
-        except Exception:
-            continue
-    return ""
+    try:
+        return driver.execute_script(_FIND_FIRST_JS, list(_LI_COMPANY_SELECTORS)).strip()
+    except Exception:
+        return ""
 
 
 # ----------------------------
 # LinkedIn Auth Scraper
 # ----------------------------
-def scrape_linkedin_authenticated(driver, seen_signatures, seen_urls, new_jobs_buffer):
+def scrape_linkedin_authenticated(driver, seen_signatures, seen_urls, new_jobs_buffer, on_save=None):
     print("\n\n=== STARTING LINKEDIN CHECK (AUTHENTICATED) ===")
 
     # Initialize prev_description outside the loops to track across jobs
@@ -421,8 +808,20 @@ def scrape_linkedin_authenticated(driver, seen_signatures, seen_urls, new_jobs_b
 
         search_url = (f"https://www.linkedin.com/jobs/search/?keywords={kw.replace(' ', '%20')}"
                       f"&location={LOCATION.replace(' ', '%20')}")
-        driver.get(search_url)
-        time.sleep(5)
+        navigate_warm(driver, search_url)
+        # navigate_warm returns before the navigation commits, so for every
+        # keyword after the first the previous results page still satisfies
+        # the card-presence wait below. Anchor on a pre-navigation card and
+        # wait for it to go stale first - same pattern as the next-page
+        # handler. A fresh session has no card yet; the presence wait alone
+        # covers that case.
+        try:
+            old_card = driver.find_element(By.CSS_SELECTOR, ".job-card-container")
+            WebDriverWait(driver, 10).until(EC.staleness_of(old_card))
+        except NoSuchElementException:
+            pass
+        except TimeoutException:
+            print("   [WARN] Old results did not unload; continuing.")
 
         current_page_num = 1
 
@@ -445,16 +844,32 @@ def scrape_linkedin_authenticated(driver, seen_signatures, seen_urls, new_jobs_b
                 print("   [ERROR] No job cards found on this page.")
                 break
 
-            # Scroll list container to load more than a handful of cards
+            # Scroll list container to load more than a handful of cards,
+            # waiting on card-count growth instead of fixed pauses and
+            # stopping as soon as the lazy list stops growing.
+            def _count_cards(d):
+                return len(d.find_elements(By.CSS_SELECTOR, ".job-card-container"))
+
             try:
                 first_card = driver.find_element(By.CSS_SELECTOR, ".job-card-container")
                 scroll_container = first_card.find_element(By.XPATH, "./../../..")
+                prev_count = _count_cards(driver)
                 for _ in range(10):
                     driver.execute_script("arguments[0].scrollTop = arguments[0].scrollHeight", scroll_container)
-                    time.sleep(0.6)
+                    try:
+                        WebDriverWait(driver, 1.5, poll_frequency=0.1).until(
+                            lambda d: _count_cards(d) > prev_count)
+                    except TimeoutException:
+                        break  # list fully rendered
+                    prev_count = _count_cards(driver)
             except Exception:
+                prev_count = _count_cards(driver)
                 driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                time.sleep(2)
+                try:
+                    WebDriverWait(driver, 2, poll_frequency=0.2).until(
+                        lambda d: _count_cards(d) > prev_count)
+                except TimeoutException:
+                    pass  # nothing more to load
 
             cards = driver.find_elements(By.CSS_SELECTOR, ".job-card-container")
             if not cards:
@@ -462,25 +877,30 @@ def scrape_linkedin_authenticated(driver, seen_signatures, seen_urls, new_jobs_b
 
             print(f"      Found {len(cards)} visible cards.")
 
+            try:
+                driver.execute_script(_DESC_OBSERVER_JS)
+            except Exception:
+                pass  # observer is an optimization; the text check still guards
+
             for card in cards:
                 if len(new_jobs_buffer) >= MAX_JOBS_TO_SCRAPE:
                     return
 
                 try:
                     driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", card)
-                    time.sleep(0.1)
-
-                    card_html = card.get_attribute("outerHTML")
 
-                    # Title (and safe title_elem)
+                    # Title (and safe title_elem). outerHTML is a large
+                    # string round trip, so it's only fetched on the
+                    # fallback path where the direct lookup failed.
                     title_elem = None
                     try:
                         title_elem = card.find_element(By.CSS_SELECTOR, ".job-card-list__title")
                         raw_title = fix_doubled_title(title_elem.text.strip())
                     except Exception:
-                        raw_title = linkedin_title_from_card_html(card_html)
+                        raw_title = linkedin_title_from_card_html(card.get_attribute("outerHTML"))
 
                     job_url = linkedin_url_from_card(card)
+                    title_lower = raw_title.lower()  # computed once per card
 
                     if is_missing(raw_title):
                         if DEBUG_EVERY_SKIP:
@@ -495,8 +915,30 @@ def scrape_linkedin_authenticated(driver, seen_signatures, seen_urls, new_jobs_b
 
                     dbg("LI_CARD", title=raw_title, url=job_url)
 
+                    # Keywords filter - runs BEFORE the click so an
+                    # irrelevant card never pays the pane-sync (3s) and
+                    # description (6s) waits
+                    title_cats = keyword_categories(title_lower)
+                    if "BAD" in title_cats:
+                        if DEBUG_EVERY_SKIP:
+                            dbg("LI_SKIP_BAD_KW", title=raw_title, reason="bad keyword")
+                        continue
+
+                    if "STRONG" in title_cats:
+                        relevance_type = "KEEP_IMMEDIATE"
+                    elif "AMBIG" in title_cats:
+                        relevance_type = "CHECK_DESCRIPTION"
+                    else:
+                        if DEBUG_EVERY_SKIP:
+                            dbg("LI_SKIP", title=raw_title, reason="irrelevant title")
+                        continue
+
                     # Click card to load pane
                     print(f"      [CLICKING] {raw_title}")
+                    try:
+                        driver.execute_script("window.__descChanged = false;")
+                    except Exception:
+                        pass
                     try:
                         if title_elem:
                             title_elem.click()
@@ -508,39 +950,26 @@ def scrape_linkedin_authenticated(driver, seen_signatures, seen_urls, new_jobs_b
                         continue
 
                     # --- SYNCHRONIZATION: Wait for Pane Title to Match Card Title ---
-                    wait = WebDriverWait(driver, 10)
-                    pane_matched = False
-                    
-                    # Try to find the title in the detail pane
-                    pane_title_selectors = [
-                        ".job-details-jobs-unified-top-card__job-title",
-                        ".jobs-unified-top-card__job-title",
-                        "h2.t-24", # Common LinkedIn header class
-                        "[data-test-job-details-header-title]"
-                    ]
-
-                    for _ in range(15): # ~3 seconds check
-                        for sel in pane_title_selectors:
-                            try:
-                                el = driver.find_element(By.CSS_SELECTOR, sel)
-                                txt = fix_doubled_title(el.text.strip())
-                                if not txt: continue
-                                
-                                # Compare card title vs pane title
-                                if raw_title.lower() in txt.lower() or txt.lower() in raw_title.lower():
-                                    pane_matched = True
-                                    break
-                            except Exception:
-                                pass
-                        if pane_matched:
-                            break
-                        time.sleep(0.2)
-
-                    if not pane_matched:
-                         # Fallback: Sometimes only company is reliably selectable in pane structure
-                         if DEBUG_EVERY_SKIP:
+                    # One _FIND_FIRST_JS hop per poll tick walks every
+                    # selector in-page, vs a find_element round trip each
+                    def _pane_title_matches(d):
+                        txt = fix_doubled_title(
+                            d.execute_script(_FIND_FIRST_JS, list(_LI_PANE_TITLE_SELECTORS)).strip())
+                        if not txt:
+                            return False
+                        # Compare card title vs pane title
+                        txt = txt.lower()
+                        return title_lower in txt or txt in title_lower
+
+                    try:
+                        # Same ~3s budget as the old 15x0.2s loop, but returns
+                        # the moment the pane catches up
+                        WebDriverWait(driver, 3, poll_frequency=0.1).until(_pane_title_matches)
+                    except TimeoutException:
+                        # Fallback: Sometimes only company is reliably selectable in pane structure
+                        if DEBUG_EVERY_SKIP:
                             dbg("LI_SKIP_SYNC", title=raw_title, reason="Pane did not update to match card title")
-                         continue
+                        continue
 
                     # Company from pane (now safe to read)
                     raw_company = linkedin_company_from_pane(driver)
@@ -553,44 +982,41 @@ def scrape_linkedin_authenticated(driver, seen_signatures, seen_urls, new_jobs_b
                         continue
 
                     # Duplicates by sig
-                    sig = (raw_title.lower().strip(), raw_company.lower().strip())
+                    sig = (title_lower.strip(), raw_company.lower().strip())
                     if sig in seen_signatures:
                         if DEBUG_EVERY_SKIP:
                             dbg("LI_SKIP_DUP_SIG", title=raw_title, company=raw_company, url=job_url, reason="duplicate")
                         continue
 
-                    # Keywords filter
-                    title_lower = raw_title.lower()
-                    if any(bad in title_lower for bad in BAD_KEYWORDS):
-                        if DEBUG_EVERY_SKIP:
-                            dbg("LI_SKIP_BAD_KW", title=raw_title, company=raw_company, reason="bad keyword")
-                        continue
-
-                    relevance_type = "SKIP"
-                    if any(s in title_lower for s in STRONG_KEYWORDS):
-                        relevance_type = "KEEP_IMMEDIATE"
-                    elif any(a in title_lower for a in AMBIGUOUS_KEYWORDS):
-                        relevance_type = "CHECK_DESCRIPTION"
-
-                    if relevance_type == "SKIP":
-                        if DEBUG_EVERY_SKIP:
-                            dbg("LI_SKIP", title=raw_title, company=raw_company, reason="irrelevant title")
-                        continue
-
-                    # Description - STRICT PREV_DESC CHECK
-                    description = "N/A"
-                    start_desc_time = time.time()
-                    while (time.time() - start_desc_time) < 6.0:
+                    # Description - STRICT PREV_DESC CHECK: text must exist
+                    # AND differ from the previous job's description. The
+                    # mutation flag gates the expensive text read: most poll
+                    # ticks cost one boolean round trip, and the text is
+                    # only serialized after the pane actually mutated.
+                    def _desc_changed(d):
+                        try:
+                            if not d.execute_script("return window.__descChanged === true;"):
+                                return False
+                        except Exception:
+                            pass  # no observer; fall through to the text check
+                        try:
+                            txt = d.find_element(By.ID, "job-details").text.strip()
+                        except Exception:
+                            return False
+                        if txt and (txt != prev_description or prev_description == ""):
+                            return txt
+                        # Mutation was unrelated (still the old card's text):
+                        # re-arm the flag and keep waiting
                         try:
-                            desc_elem = driver.find_element(By.ID, "job-details")
-                            txt = desc_elem.text.strip()
-                            # Ensure text exists AND is different from previous job description
-                            if txt and (txt != prev_description or prev_description == ""):
-                                description = txt
-                                break
+                            d.execute_script("window.__descChanged = false;")
                         except Exception:
                             pass
-                        time.sleep(0.5)
+                        return False
+
+                    try:
+                        description = WebDriverWait(driver, 6, poll_frequency=0.25).until(_desc_changed)
+                    except TimeoutException:
+                        description = "N/A"
 
                     # Update the previous description tracker
                     if description != "N/A":
@@ -602,7 +1028,7 @@ def scrape_linkedin_authenticated(driver, seen_signatures, seen_urls, new_jobs_b
                         should_save = True
                         print(f"         [KEEP STRONG] {raw_title}")
                     elif relevance_type == "CHECK_DESCRIPTION":
-                        if description != "N/A" and any(t in description.lower() for t in TECH_KEYWORDS):
+                        if description != "N/A" and has_category(description.lower(), "TECH"):
                             should_save = True
                             print(f"         [KEEP VERIFIED] {raw_title}")
                         else:
@@ -621,12 +1047,15 @@ def scrape_linkedin_authenticated(driver, seen_signatures, seen_urls, new_jobs_b
                             "scraped_at": time.strftime("%Y-%m-%d %H:%M:%S")
                         }
                         new_jobs_buffer.append(data)
+                        if on_save:
+                            on_save(data)
                         if job_url:
                             seen_urls.add(job_url)
                         seen_signatures.add(sig)
                         dbg("LI_BUFFERED", title=raw_title, company=raw_company, url=job_url)
-
-                    time.sleep(random.uniform(0.4, 1.2))
+                        # Jitter only after the full click+read sequence of a
+                        # kept job - skipped/filtered cards don't pay it
+                        time.sleep(random.uniform(0.4, 1.2))
 
                 except Exception as e:
                     if DEBUG_EVERY_SKIP:
@@ -640,11 +1069,16 @@ def scrape_linkedin_authenticated(driver, seen_signatures, seen_urls, new_jobs_b
             try:
                 next_button = driver.find_element(By.CSS_SELECTOR, f"button[aria-label='Page {next_page_num}']")
                 driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", next_button)
-                time.sleep(0.4)
+                old_first = cards[0] if cards else None
                 next_button.click()
                 print(f"   >>> Clicked Page {next_page_num}. Loading...")
                 current_page_num += 1
-                time.sleep(4)
+                # Wait for the actual page swap: the old first card goes
+                # stale, then the new list renders.
+                if old_first is not None:
+                    WebDriverWait(driver, 10).until(EC.staleness_of(old_first))
+                WebDriverWait(driver, 10).until(
+                    EC.presence_of_element_located((By.CSS_SELECTOR, ".job-card-container")))
             except NoSuchElementException:
                 print("   [INFO] No next page button found. End of results.")
                 break
@@ -653,85 +1087,107 @@ def scrape_linkedin_authenticated(driver, seen_signatures, seen_urls, new_jobs_b
                 break
 
 
+def read_output_csv(**kwargs):
+    """Read OUTPUT_FILE, preferring pandas' pyarrow parser (multithreaded,
+    ~3-5x faster on large files) and falling back to the default C engine
+    when pyarrow isn't installed or rejects an option."""
+    try:
+        return pd.read_csv(OUTPUT_FILE, engine="pyarrow", **kwargs)
+    except (ImportError, ValueError):
+        return pd.read_csv(OUTPUT_FILE, **kwargs)
+
+
 # ==========================================
 # VERIFY AND CLEAN EXISTING CSV
 # ==========================================
+_DEAD_PHRASES = (
+    "this job posting is temporarily unavailable",
+    "job no longer available",
+    "this job has expired",
+    "no longer accepting applications",
+    "job is no longer available",
+)
+
+
+def _check_job_url(sess, url, csv_title):
+    """
+    True if the posting still looks alive: not 404/410, not bounced back to
+    search, no "expired" boilerplate, and the stored title still on the page.
+    Errs on keeping when the request itself fails.
+    """
+    csv_title_lower = csv_title.lower()
+    try:
+        # Cheap probe first: dead URLs answer the HEAD, no body transferred
+        head = sess.head(url, allow_redirects=True, timeout=5)
+        if head.status_code in (404, 410):
+            print(f"   [REMOVING - HTTP {head.status_code}] {csv_title}")
+            return False
+
+        resp = sess.get(url, allow_redirects=True, timeout=10)
+        if resp.status_code in (404, 410):
+            print(f"   [REMOVING - HTTP {resp.status_code}] {csv_title}")
+            return False
+
+        # 1. Negative Checks
+        if "simplyhired" in url and "/job/" in url and "/search" in resp.url.lower():
+            print(f"   [REMOVING - Redirected] {csv_title}")
+            return False
+
+        # Unescape before matching: titles with &, ' etc. appear as
+        # &amp;/&#x27; in the raw source and would never substring-match.
+        body_text = html.unescape(resp.text).lower()
+        if any(phrase in body_text for phrase in _DEAD_PHRASES):
+            print(f"   [REMOVING - Unavailable Msg] {csv_title}")
+            return False
+
+        # 2. Positive Check (Title Match)
+        if csv_title_lower in body_text:
+            return True
+        print(f"   [REMOVING - Title Mismatch] CSV Title: '{csv_title}' not found on page.")
+        return False
+
+    except Exception as e:
+        print(f"   [ERROR verifying] {url}: {e}")
+        return True  # Keep on crash
+
+
 def verify_and_clean_data():
     if not os.path.exists(OUTPUT_FILE):
         print(f"File {OUTPUT_FILE} not found.")
         return
 
     print(f"\n=== VERIFYING URLS IN {OUTPUT_FILE} ===")
-    print("Method: Checking if CSV Job Title exists on the webpage (using Selenium)...")
+    print("Method: Checking if CSV Job Title exists in the page HTML (pooled HTTP)...")
 
-    df = pd.read_csv(OUTPUT_FILE)
+    df = read_output_csv()
     if "url" not in df.columns or "title" not in df.columns:
         print("Error: CSV must have 'url' and 'title' columns.")
         return
 
     original_count = len(df)
-    valid_mask = []
-    
-    driver = make_driver()
-
-    try:
-        for index, row in df.iterrows():
-            url = row.get("url", "")
-            raw_title = str(row.get("title", ""))
-            csv_title = fix_doubled_title(raw_title).strip()
-
-            if not isinstance(url, str) or not url.startswith("http") or not csv_title:
-                valid_mask.append(False)
-                continue
-
-            try:
-                driver.get(url)
-                time.sleep(1.2) # Wait for DOM
-
-                body_text = driver.find_element(By.TAG_NAME, "body").text.lower()
-                current_url = driver.current_url.lower()
-                csv_title_lower = csv_title.lower()
-
-                # 1. Negative Checks
-                is_dead = False
-                if "simplyhired" in url and "/job/" in url and "/search" in current_url:
-                     is_dead = True
-                     print(f"   [REMOVING - Redirected] {csv_title}")
-
-                dead_phrases = [
-                    "this job posting is temporarily unavailable",
-                    "job no longer available",
-                    "this job has expired",
-                    "no longer accepting applications",
-                    "job is no longer available"
-                ]
-                if any(phrase in body_text for phrase in dead_phrases):
-                    is_dead = True
-                    print(f"   [REMOVING - Unavailable Msg] {csv_title}")
-
-                if is_dead:
-                    valid_mask.append(False)
-                    continue
-
-                # 2. Positive Check (Title Match)
-                if csv_title_lower in body_text:
-                    valid_mask.append(True)
-                else:
-                    print(f"   [REMOVING - Title Mismatch] CSV Title: '{csv_title}' not found on page.")
-                    valid_mask.append(False)
-
-            except Exception as e:
-                print(f"   [ERROR verifying] {url}: {e}")
-                valid_mask.append(True) # Keep on crash
-
-            if (index + 1) % 10 == 0:
-                print(f"   Checked {index + 1}/{original_count}...")
 
-    finally:
-        driver.quit()
+    # One session with a connection pool sized to the thread count: TCP/TLS
+    # handshakes are paid once per host instead of once per URL.
+    sess = requests.Session()
+    sess.headers.update(_HTTP_HEADERS)
+    adapter = requests.adapters.HTTPAdapter(
+        pool_connections=VERIFY_WORKERS, pool_maxsize=VERIFY_WORKERS, max_retries=1)
+    sess.mount("https://", adapter)
+    sess.mount("http://", adapter)
+
+    def _check_row(row):
+        url, raw_title = row
+        csv_title = fix_doubled_title(str(raw_title)).strip()
+        if not isinstance(url, str) or not url.startswith("http") or not csv_title:
+            return False
+        return _check_job_url(sess, url, csv_title)
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=VERIFY_WORKERS) as ex:
+        valid_mask = list(ex.map(_check_row, zip(df["url"], df["title"])))
 
     df["is_valid"] = valid_mask
-    df_clean = df[df["is_valid"] == True].drop(columns=["is_valid"])
+    # Boolean mask used directly - no == True broadcast pass
+    df_clean = df.loc[df["is_valid"]].drop(columns=["is_valid"])
     removed_count = original_count - len(df_clean)
 
     print(f"\nFinished Checking.")
@@ -749,170 +1205,444 @@ def verify_and_clean_data():
         print("   No changes needed. File is clean.")
 
 
+def open_seen_db():
+    """Opens (creating if needed) the persistent seen-URL/signature index."""
+    con = sqlite3.connect(SEEN_DB_FILE)
+    con.execute("CREATE TABLE IF NOT EXISTS seen(url TEXT PRIMARY KEY)")
+    con.execute("CREATE TABLE IF NOT EXISTS sigs(title TEXT, company TEXT, "
+                "PRIMARY KEY(title, company))")
+    return con
+
+
 # ==========================================
-# MAIN ENTRY POINT
+# SIMPLYHIRED KEYWORD WORKER
 # ==========================================
-def run_scraper():
-    seen_urls = set()
-    seen_signatures = set()
+def scrape_simplyhired_keyword(kw, seen_urls, seen_signatures):
+    """
+    Scrape one SimplyHired keyword with a dedicated driver.
+    Runs in a worker process: gets snapshot copies of the seen sets and
+    returns the list of new job dicts; the parent merges and dedups.
+    """
+    print(f"\n=== SEARCHING (SimplyHired): {kw} ===")
+    # One worker per keyword, so the keyword slug is a stable, collision-free
+    # profile name; the worker's cache then survives across runs.
+    driver = make_driver(profile="worker-" + re.sub(r"[^a-z0-9]+", "-", kw.lower()).strip("-"))
+    new_jobs = []
 
-    if os.path.exists(OUTPUT_FILE):
-        try:
-            old_df = pd.read_csv(OUTPUT_FILE)
-            if "url" in old_df.columns:
-                seen_urls = set(old_df["url"].dropna().tolist())
-            if "title" in old_df.columns and "company" in old_df.columns:
-                for _, row in old_df.iterrows():
-                    t = str(row.get('title', '')).lower().strip()
-                    c = str(row.get('company', '')).lower().strip()
-                    if t and c:
-                        seen_signatures.add((t, c))
-            print(f"Found existing file with {len(seen_urls)} jobs.")
-        except Exception as e:
-            print(f"Could not read existing file: {e}. Starting fresh.")
-    else:
-        print("No existing file found. Starting fresh.")
+    try:
+        driver.get(
+            f"https://www.simplyhired.ca/search?q={kw.replace(' ', '+')}&l={LOCATION.replace(' ', '+')}&w={RADIUS}&so=d"
+        )
+        page_num = 1
+        while page_num <= MAX_PAGES_PER_KEYWORD:
+            WebDriverWait(driver, 10).until(EC.presence_of_element_located((By.ID, "job-list")))
+            cards = driver.find_elements(By.CSS_SELECTOR, "div[class*='SerpJob']")
+            if not cards:
+                cards = driver.find_elements(By.CSS_SELECTOR, "#job-list > li")
+            print(f"Page {page_num}: Found {len(cards)} cards.")
+
+            # Collect every card's (title, href) in ONE JS pass, triage in
+            # Python, and only click-and-parse the survivors. The expensive
+            # pane round-trips never happen for BAD/irrelevant/seen cards.
+            pairs = driver.execute_script(
+                "return Array.from(document.querySelectorAll(\"a[class*='jobTitle']\"))"
+                ".map(a => [a.innerText, a.href,"
+                " (c => c ? (c.querySelector(\"span[data-testid='companyName']\") || {innerText: ''}).innerText : '')"
+                "(a.closest(\"div[class*='SerpJob'], li\"))]);"
+            ) or []
+
+            keepers = []  # (card index, card_meta dict, relevance type)
+            for i, (raw_text, href, raw_company) in enumerate(pairs):
+                raw_title = fix_doubled_title(norm(raw_text))
+                check_url = href.split("?")[0] if href else ""
+
+                if is_missing(raw_title):
+                    if DEBUG_EVERY_SKIP:
+                        dbg("SKIP_SH", reason="empty title on card")
+                    continue
 
-    driver = make_driver()
-    new_jobs_buffer = []
-    total_saved_this_run = 0
+                if check_url and check_url in seen_urls:
+                    if DEBUG_EVERY_SKIP:
+                        dbg("SKIP_DUP_URL_CARD", title=raw_title, url=check_url, reason="already seen")
+                    continue
 
-    try:
-        # --- 1. SIMPLYHIRED ---
-        for kw in KEYWORDS:
-            print(f"\n=== SEARCHING (SimplyHired): {kw} ===")
-            driver.get(
-                f"https://www.simplyhired.ca/search?q={kw.replace(' ', '+')}&l={LOCATION.replace(' ', '+')}&w={RADIUS}&so=d"
-            )
-            page_num = 1
-            while page_num <= MAX_PAGES_PER_KEYWORD:
-                WebDriverWait(driver, 10).until(EC.presence_of_element_located((By.ID, "job-list")))
-                cards = driver.find_elements(By.CSS_SELECTOR, "div[class*='SerpJob']")
-                if not cards:
-                    cards = driver.find_elements(By.CSS_SELECTOR, "#job-list > li")
-                print(f"Page {page_num}: Found {len(cards)} cards.")
+                title_cats = keyword_categories(raw_title.lower())
+
+                if "BAD" in title_cats:
+                    if DEBUG_EVERY_SKIP:
+                        dbg("SKIP_BAD_KW_SH", title=raw_title, reason="bad keyword in title")
+                    continue
+
+                relevance_type = "SKIP"
+                if "STRONG" in title_cats:
+                    relevance_type = "KEEP_IMMEDIATE"
+                elif "AMBIG" in title_cats:
+                    relevance_type = "CHECK_DESCRIPTION"
+
+                if relevance_type == "SKIP":
+                    if DEBUG_EVERY_SKIP:
+                        dbg("SKIP_IRRELEVANT_SH", title=raw_title, reason="no matching keywords")
+                    continue
+
+                keepers.append((i, {"title": raw_title,
+                                    "url": check_url,
+                                    "company": norm(raw_company)}, relevance_type))
+
+            def _fetch_cards():
+                found = driver.find_elements(By.CSS_SELECTOR, "div[class*='SerpJob']")
+                return found or driver.find_elements(By.CSS_SELECTOR, "#job-list > li")
 
-                prev_description = ""
-                for i in range(len(cards)):
-                    if total_saved_this_run >= MAX_JOBS_TO_SCRAPE:
-                        break
+            prev_description = ""
+            for i, card_meta, relevance_type in keepers:
+                raw_title = card_meta["title"]
+                if len(new_jobs) >= MAX_JOBS_TO_SCRAPE:
+                    break
 
+                try:
+                    # Plain iteration doesn't invalidate the references
+                    # fetched at the top of the page; re-query only if a
+                    # card actually went stale.
+                    if i >= len(cards):
+                        continue
+                    card = cards[i]
                     try:
-                        # re-fetch (avoid stale)
-                        cards = driver.find_elements(By.CSS_SELECTOR, "div[class*='SerpJob']")
-                        if not cards:
-                            cards = driver.find_elements(By.CSS_SELECTOR, "#job-list > li")
+                        card.is_enabled()  # cheap staleness poke
+                    except StaleElementReferenceException:
+                        cards = _fetch_cards()
+                        if i >= len(cards):
+                            continue
                         card = cards[i]
 
-                        # Duplicate URL check at card level
-                        try:
-                            temp_html = card.get_attribute("outerHTML")
-                            temp_soup = BeautifulSoup(temp_html, "lxml")
-                            temp_title_tag = (temp_soup.find("a", class_=lambda x: x and "jobTitle" in x) or temp_soup.find("a"))
-                            raw_title_dbg = fix_doubled_title(temp_title_tag.get_text(strip=True)) if temp_title_tag else ""
-                            raw_href = temp_title_tag.get("href", "") if temp_title_tag else ""
-                            check_url = ("https://www.simplyhired.ca" + raw_href.split("?")[0]
-                                         if raw_href and not raw_href.startswith("http") else raw_href)
-
-                            temp_company_tag = temp_soup.find("span", attrs={"data-testid": "companyName"})
-                            raw_company_dbg = temp_company_tag.get_text(strip=True) if temp_company_tag else ""
-
-                            if check_url and check_url in seen_urls:
-                                if DEBUG_EVERY_SKIP:
-                                    dbg("SKIP_DUP_URL_CARD", title=raw_title_dbg, company=raw_company_dbg,
-                                        url=check_url, reason="already seen")
-                                continue
-                        except Exception:
-                            pass
+                    job_data = parse_job_data(driver, card, prev_description, card_meta=card_meta)
+                    if not job_data:
+                        continue
 
-                        # Title for relevance checks
-                        try:
-                            title_elem = card.find_element(By.CSS_SELECTOR, "a[class*='jobTitle']")
-                            raw_title = fix_doubled_title(title_elem.text.strip())
-                        except Exception:
-                            raw_title = fix_doubled_title(norm(card.text.split("\n")[0]))
+                    if job_data["url"] in seen_urls:
+                        if DEBUG_EVERY_SKIP:
+                            dbg("SKIP_DUP_URL_SH", title=job_data["title"], company=job_data["company"], url=job_data["url"])
+                        continue
 
-                        if is_missing(raw_title):
-                            if DEBUG_EVERY_SKIP:
-                                dbg("SKIP_SH", reason="empty title on card")
-                            continue
+                    sig = (job_data["title"].lower().strip(), job_data["company"].lower().strip())
+                    if sig in seen_signatures:
+                        if DEBUG_EVERY_SKIP:
+                            dbg("SKIP_DUP_SIG_SH", title=job_data["title"], company=job_data["company"], reason="duplicate title+company")
+                        continue
 
-                        title_lower = raw_title.lower()
+                    prev_description = job_data["description"]
 
-                        if any(bad in title_lower for bad in BAD_KEYWORDS):
+                    should_save = False
+                    if relevance_type == "KEEP_IMMEDIATE":
+                        should_save = True
+                        print(f"   [KEEP STRONG] {raw_title}")
+                    elif relevance_type == "CHECK_DESCRIPTION":
+                        if job_data["description"] != "N/A":
+                            desc_lower = job_data["description"].lower()
+                            if has_category(desc_lower, "TECH"):
+                                should_save = True
+                                print(f"   [KEEP VERIFIED] {raw_title}")
+                            else:
+                                if DEBUG_EVERY_SKIP:
+                                    dbg("SKIP_NO_TECH_SH", title=raw_title, reason="ambiguous title, no tech keywords in description")
+                        else:
                             if DEBUG_EVERY_SKIP:
-                                dbg("SKIP_BAD_KW_SH", title=raw_title, reason="bad keyword in title")
-                            continue
+                                dbg("SKIP_NO_DESC_SH", title=raw_title, reason="ambiguous title, no description")
 
-                        relevance_type = "SKIP"
-                        if any(s in title_lower for s in STRONG_KEYWORDS):
-                            relevance_type = "KEEP_IMMEDIATE"
-                        elif any(a in title_lower for a in AMBIGUOUS_KEYWORDS):
-                            relevance_type = "CHECK_DESCRIPTION"
+                    if should_save:
+                        new_jobs.append(job_data)
+                        seen_urls.add(job_data["url"])
+                        seen_signatures.add(sig)
+                        dbg("BUFFERED_SH", title=job_data["title"], company=job_data["company"],
+                            salary=job_data["salary"], url=job_data["url"])
 
-                        if relevance_type == "SKIP":
-                            if DEBUG_EVERY_SKIP:
-                                dbg("SKIP_IRRELEVANT_SH", title=raw_title, reason="no matching keywords")
-                            continue
+                except Exception as e:
+                    if DEBUG_EVERY_SKIP:
+                        dbg("ERROR_CARD_SH", reason=f"{type(e).__name__}: {str(e)[:120]}")
+                    continue
 
-                        job_data = parse_job_data(driver, card, prev_description)
-                        if not job_data:
-                            continue
+            if len(new_jobs) >= MAX_JOBS_TO_SCRAPE:
+                break
 
-                        if job_data["url"] in seen_urls:
-                            if DEBUG_EVERY_SKIP:
-                                dbg("SKIP_DUP_URL_SH", title=job_data["title"], company=job_data["company"], url=job_data["url"])
-                            continue
+            try:
+                next_btn = driver.find_element(By.CSS_SELECTOR, "a[aria-label='Next page']")
+                old_list = driver.find_element(By.ID, "job-list")
+                driver.execute_script("arguments[0].click();", next_btn)
+                page_num += 1
+                # Wait for the actual navigation instead of a fixed pause:
+                # the old list goes stale, then the new one appears.
+                WebDriverWait(driver, 10).until(EC.staleness_of(old_list))
+                WebDriverWait(driver, 10).until(EC.presence_of_element_located((By.ID, "job-list")))
+            except Exception:
+                break
+    finally:
+        driver.quit()
 
-                        sig = (job_data["title"].lower().strip(), job_data["company"].lower().strip())
-                        if sig in seen_signatures:
-                            if DEBUG_EVERY_SKIP:
-                                dbg("SKIP_DUP_SIG_SH", title=job_data["title"], company=job_data["company"], reason="duplicate title+company")
-                            continue
+    return new_jobs
 
-                        prev_description = job_data["description"]
 
-                        should_save = False
-                        if relevance_type == "KEEP_IMMEDIATE":
-                            should_save = True
-                            print(f"   [KEEP STRONG] {raw_title}")
-                        elif relevance_type == "CHECK_DESCRIPTION":
-                            if job_data["description"] != "N/A":
-                                desc_lower = job_data["description"].lower()
-                                if any(t in desc_lower for t in TECH_KEYWORDS):
-                                    should_save = True
-                                    print(f"   [KEEP VERIFIED] {raw_title}")
-                                else:
-                                    if DEBUG_EVERY_SKIP:
-                                        dbg("SKIP_NO_TECH_SH", title=raw_title, reason="ambiguous title, no tech keywords in description")
-                            else:
-                                if DEBUG_EVERY_SKIP:
-                                    dbg("SKIP_NO_DESC_SH", title=raw_title, reason="ambiguous title, no description")
+# --- HTTP backend (no browser) ---
+# SimplyHired embeds the full posting as <script type="application/ld+json">
+# JobPosting on every detail page, so everything parse_job_data scrapes out
+# of the rendered pane is available from a plain GET. No Chrome process,
+# no pane-sync waits; fetches fan out over a small thread pool.
 
-                        if should_save:
-                            new_jobs_buffer.append(job_data)
-                            seen_urls.add(job_data["url"])
-                            seen_signatures.add(sig)
-                            total_saved_this_run += 1
-                            dbg("BUFFERED_SH", title=job_data["title"], company=job_data["company"],
-                                salary=job_data["salary"], url=job_data["url"])
+_HTTP_HEADERS = {
+    "User-Agent": ("Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+                   "(KHTML, like Gecko) Chrome/126.0.0.0 Safari/537.36"),
+    "Accept-Language": "en-CA,en;q=0.9",
+}
 
-                    except Exception as e:
-                        if DEBUG_EVERY_SKIP:
-                            dbg("ERROR_CARD_SH", reason=f"{type(e).__name__}: {str(e)[:120]}")
-                        continue
 
-                if total_saved_this_run >= MAX_JOBS_TO_SCRAPE:
+def _jobposting_from_detail(sess, url):
+    """GET one detail page and decode its JSON-LD JobPosting, or None."""
+    resp = sess.get(url, timeout=15)
+    resp.raise_for_status()
+    tree = lxml_html.fromstring(resp.text)
+    for blob in tree.xpath('//script[@type="application/ld+json"]/text()'):
+        try:
+            payload = json.loads(blob)
+        except ValueError:
+            continue
+        for obj in payload if isinstance(payload, list) else [payload]:
+            if isinstance(obj, dict) and obj.get("@type") == "JobPosting":
+                return obj
+    return None
+
+
+def _salary_from_jsonld(job):
+    base = job.get("baseSalary")
+    if not isinstance(base, dict):
+        return ""
+    val = base.get("value")
+    if not isinstance(val, dict):
+        return ""
+    unit = (val.get("unitText") or "").lower()
+    suffix = f" per {unit}" if unit else ""
+    lo, hi = val.get("minValue"), val.get("maxValue")
+    if lo and hi and lo != hi:
+        return f"${lo} - ${hi}{suffix}"
+    amount = val.get("value") or lo or hi
+    return f"${amount}{suffix}" if amount else ""
+
+
+def scrape_simplyhired_keyword_http(kw, seen_urls, seen_signatures):
+    """
+    HTTP-only variant of scrape_simplyhired_keyword: same triage and dedup
+    rules, but cards come from the search-page HTML and each keeper's data
+    from its detail page's JSON-LD instead of a driven browser pane.
+    """
+    print(f"\n=== SEARCHING (SimplyHired, HTTP): {kw} ===")
+    sess = requests.Session()
+    sess.headers.update(_HTTP_HEADERS)
+    new_jobs = []
+
+    url = f"https://www.simplyhired.ca/search?q={kw.replace(' ', '+')}&l={LOCATION.replace(' ', '+')}&w={RADIUS}&so=d"
+    page_num = 1
+    while url and page_num <= MAX_PAGES_PER_KEYWORD:
+        resp = sess.get(url, timeout=15)
+        resp.raise_for_status()
+        tree = lxml_html.fromstring(resp.text)
+        tree.make_links_absolute(url)
+        anchors = tree.xpath("//a[contains(@class, 'jobTitle')]")
+        print(f"Page {page_num}: Found {len(anchors)} cards.")
+
+        keepers = []  # (card_meta dict, relevance type)
+        for a in anchors:
+            raw_title = fix_doubled_title(norm(a.text_content()))
+            href = a.get("href") or ""
+            check_url = href.split("?")[0] if href else ""
+
+            if is_missing(raw_title) or not check_url:
+                continue
+            if check_url in seen_urls:
+                if DEBUG_EVERY_SKIP:
+                    dbg("SKIP_DUP_URL_CARD", title=raw_title, url=check_url, reason="already seen")
+                continue
+
+            title_cats = keyword_categories(raw_title.lower())
+            if "BAD" in title_cats:
+                if DEBUG_EVERY_SKIP:
+                    dbg("SKIP_BAD_KW_SH", title=raw_title, reason="bad keyword in title")
+                continue
+            if "STRONG" in title_cats:
+                relevance_type = "KEEP_IMMEDIATE"
+            elif "AMBIG" in title_cats:
+                relevance_type = "CHECK_DESCRIPTION"
+            else:
+                if DEBUG_EVERY_SKIP:
+                    dbg("SKIP_IRRELEVANT_SH", title=raw_title, reason="no matching keywords")
+                continue
+
+            keepers.append(({"title": raw_title, "url": check_url, "company": ""}, relevance_type))
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=SIMPLYHIRED_HTTP_WORKERS) as pool:
+            postings = pool.map(
+                lambda m: _try_or_none(_jobposting_from_detail, sess, m[0]["url"]),
+                keepers)
+            for (card_meta, relevance_type), posting in zip(keepers, postings):
+                if len(new_jobs) >= MAX_JOBS_TO_SCRAPE:
                     break
+                if posting is None:
+                    continue
 
-                try:
-                    next_btn = driver.find_element(By.CSS_SELECTOR, "a[aria-label='Next page']")
-                    driver.execute_script("arguments[0].click();", next_btn)
-                    page_num += 1
-                    time.sleep(3)
-                except Exception:
+                org = posting.get("hiringOrganization")
+                company = norm(org.get("name", "")) if isinstance(org, dict) else ""
+                if REQUIRE_COMPANY and is_missing(company):
+                    continue
+
+                desc_html = posting.get("description") or ""
+                description = norm(lxml_html.fromstring(desc_html).text_content()) if desc_html else "N/A"
+
+                salary = _salary_from_jsonld(posting)
+                if not salary and description != "N/A":
+                    salary = clean_salary_text(description)
+                salary = salary or "N/A"
+                if REQUIRE_SALARY and is_missing(salary):
+                    continue
+
+                sig = (card_meta["title"].lower().strip(), company.lower().strip())
+                if sig in seen_signatures:
+                    continue
+
+                if relevance_type == "CHECK_DESCRIPTION":
+                    if description == "N/A" or not has_category(description.lower(), "TECH"):
+                        continue
+
+                job_data = {
+                    "title": card_meta["title"],
+                    "company": company,
+                    "url": card_meta["url"],
+                    "description": description,
+                    "salary": salary,
+                    "qualifications": "N/A",  # not part of the JSON-LD schema
+                    "scraped_at": time.strftime("%Y-%m-%d %H:%M:%S"),
+                }
+                new_jobs.append(job_data)
+                seen_urls.add(job_data["url"])
+                seen_signatures.add(sig)
+                dbg("BUFFERED_SH", title=job_data["title"], company=job_data["company"],
+                    salary=job_data["salary"], url=job_data["url"])
+
+        if len(new_jobs) >= MAX_JOBS_TO_SCRAPE:
+            break
+        next_href = tree.xpath("//a[@aria-label='Next page']/@href")
+        url = next_href[0] if next_href else None
+        page_num += 1
+
+    return new_jobs
+
+
+def _try_or_none(fn, *args):
+    try:
+        return fn(*args)
+    except Exception as e:
+        if DEBUG_EVERY_SKIP:
+            dbg("ERROR_CARD_SH", reason=f"{type(e).__name__}: {str(e)[:120]}")
+        return None
+
+
+def _scrape_simplyhired_worker(args):
+    kw, seen_urls, seen_signatures = args
+    if SIMPLYHIRED_USE_HTTP:
+        return scrape_simplyhired_keyword_http(kw, seen_urls, seen_signatures)
+    return scrape_simplyhired_keyword(kw, seen_urls, seen_signatures)
+
+
+# ==========================================
+# MAIN ENTRY POINT
+# ==========================================
+def run_scraper():
+    # URLs and title+company signatures live in a small sqlite index so
+    # startup is two bulk SELECTs, not a re-parse of the whole CSV as it
+    # grows; the CSV is only consulted once to migrate old runs.
+    seen_db = open_seen_db()
+    seen_urls = {row[0] for row in seen_db.execute("SELECT url FROM seen")}
+    seen_signatures = set(seen_db.execute("SELECT title, company FROM sigs"))
+
+    if (not seen_urls or not seen_signatures) and os.path.exists(OUTPUT_FILE):
+        try:
+            # Probe the header alone, then load only the columns the
+            # migration needs - the descriptions are by far the widest
+            # column and are irrelevant here. dtype=str: every column is
+            # text, so skip numeric inference.
+            header_cols = read_output_csv(nrows=0).columns
+            wanted = [c for c in ("url", "title", "company") if c in header_cols]
+            old_df = read_output_csv(usecols=wanted, dtype=str) if wanted else pd.DataFrame()
+            if not seen_urls and "url" in old_df.columns:
+                # One-time migration of a pre-index CSV into the database
+                urls = old_df["url"].dropna().tolist()
+                with seen_db:
+                    seen_db.executemany("INSERT OR IGNORE INTO seen VALUES(?)",
+                                        [(u,) for u in urls])
+                seen_urls = set(urls)
+            if not seen_signatures and "title" in old_df.columns and "company" in old_df.columns:
+                # Vectorized: two C-level string passes instead of iterrows
+                titles = old_df["title"].astype(str).str.lower().str.strip()
+                companies = old_df["company"].astype(str).str.lower().str.strip()
+                keep = (titles != "") & (companies != "")
+                seen_signatures = set(zip(titles[keep], companies[keep]))
+                with seen_db:
+                    seen_db.executemany("INSERT OR IGNORE INTO sigs VALUES(?,?)",
+                                        list(seen_signatures))
+            print(f"Migrated existing file: {len(seen_urls)} urls, {len(seen_signatures)} signatures.")
+        except Exception as e:
+            print(f"Could not read existing file: {e}. Starting fresh.")
+    else:
+        print(f"Seen index: {len(seen_urls)} urls, {len(seen_signatures)} signatures.")
+
+    new_jobs_buffer = []
+
+    # Incremental, crash-safe output: every accepted job is written (and
+    # flushed) to the CSV the moment it's merged, instead of buffering the
+    # whole run in memory. Summarization happens as a post-pass below.
+    header_needed = (not os.path.exists(OUTPUT_FILE)) or (os.path.getsize(OUTPUT_FILE) == 0)
+    # 64KiB buffer: a row with a long description exceeds the default 8KiB,
+    # so each per-row flush stays a single write syscall.
+    out_f = open(OUTPUT_FILE, "a", newline="", encoding="utf-8", buffering=1 << 16)
+    writer = csv.writer(out_f)
+    if header_needed:
+        writer.writerow(OUTPUT_COLUMNS)
+        out_f.flush()
+
+    def save_row(job_data):
+        # Plain csv.writer on a value list: no per-row dict rebuild, no
+        # pandas machinery. The flush is deliberate - a crash mid-run must
+        # not lose rows that were already scraped.
+        writer.writerow([job_data.get(col, "N/A") for col in OUTPUT_COLUMNS])
+        out_f.flush()
+        url = job_data.get("url")
+        sig = (str(job_data.get("title", "")).lower().strip(),
+               str(job_data.get("company", "")).lower().strip())
+        with seen_db:
+            if url and url != "N/A":
+                seen_db.execute("INSERT OR IGNORE INTO seen VALUES(?)", (url,))
+            if sig[0] and sig[1]:
+                seen_db.execute("INSERT OR IGNORE INTO sigs VALUES(?,?)", sig)
+
+    # --- 1. SIMPLYHIRED (parallel across keywords) ---
+    # Each worker process drives its own Chrome for one keyword; results are
+    # merged here with a final dedup pass since workers only see a snapshot
+    # of the seen sets.
+    workers = min(SIMPLYHIRED_WORKERS, len(KEYWORDS)) or 1
+    work_items = [(kw, set(seen_urls), set(seen_signatures)) for kw in KEYWORDS]
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as ex:
+        futures = [ex.submit(_scrape_simplyhired_worker, item) for item in work_items]
+        # Merge in completion order, not keyword order: a fast keyword's rows
+        # hit the CSV while slower workers are still scraping.
+        for fut in concurrent.futures.as_completed(futures):
+            for job_data in fut.result():
+                if len(new_jobs_buffer) >= MAX_JOBS_TO_SCRAPE:
                     break
+                sig = (job_data["title"].lower().strip(), job_data["company"].lower().strip())
+                if job_data["url"] in seen_urls or sig in seen_signatures:
+                    continue  # cross-worker duplicate
+                new_jobs_buffer.append(job_data)
+                save_row(job_data)
+                seen_urls.add(job_data["url"])
+                seen_signatures.add(sig)
 
+    driver = make_driver(headless=False)  # manual LinkedIn login needs a window
+
+    try:
         # --- 2. PAUSE FOR LOGIN ---
         print("\n" + "=" * 50)
         print(">>> PAUSING FOR LINKEDIN LOGIN <<<")
@@ -924,23 +1654,42 @@ def run_scraper():
         input(">>> Press ENTER once logged in...")
 
         # --- 3. SCRAPE LINKEDIN ---
-        scrape_linkedin_authenticated(driver, seen_signatures, seen_urls, new_jobs_buffer)
+        scrape_linkedin_authenticated(driver, seen_signatures, seen_urls, new_jobs_buffer,
+                                      on_save=save_row)
 
     finally:
         driver.quit()
+        out_f.close()
+        seen_db.close()
 
         if new_jobs_buffer:
-            print(f"\nScraping complete. Found {len(new_jobs_buffer)} NEW jobs.")
+            # Raw rows are already on disk; summarize as a post-pass and
+            # write the condensed descriptions back by URL.
+            print(f"\nScraping complete. Found {len(new_jobs_buffer)} NEW jobs (raw rows already saved).")
             df_final_new = summarize_new_jobs_buffer(new_jobs_buffer)
-
-            # Enforce column order + fill missing
             df_final_new = df_final_new.reindex(columns=OUTPUT_COLUMNS, fill_value="N/A")
 
-            # Append
-            header = (not os.path.exists(OUTPUT_FILE)) or (os.path.getsize(OUTPUT_FILE) == 0)
-            df_final_new.to_csv(OUTPUT_FILE, mode="a", header=header, index=False, encoding="utf-8")
-
-            print(f"Success: Appended {len(df_final_new)} jobs to {OUTPUT_FILE}.")
+            try:
+                df_all = read_output_csv()
+                # LinkedIn rows can be saved with url "N/A"; keying those
+                # into the update index would stamp one job's summary onto
+                # every historical no-url row, so only real urls map back
+                # (same guard save_row applies to the seen index).
+                urls = df_final_new["url"].astype(str)
+                updates = (df_final_new[urls.ne("N/A") & urls.ne("")]
+                           .drop_duplicates(subset=["url"]).set_index("url"))
+                mask = df_all["url"].isin(updates.index)
+                df_all.loc[mask, "description"] = df_all.loc[mask, "url"].map(updates["description"])
+                df_all.loc[mask, "salary"] = df_all.loc[mask, "url"].map(updates["salary"])
+                # 1MiB buffer so the full-file rewrite goes out in a few
+                # large writes; quoting pinned so every run emits the same
+                # CSV dialect the incremental writer uses.
+                with open(OUTPUT_FILE, "w", newline="", encoding="utf-8",
+                          buffering=1 << 20) as f:
+                    df_all.to_csv(f, index=False, quoting=csv.QUOTE_MINIMAL)
+                print(f"Success: Saved {len(df_final_new)} new jobs to {OUTPUT_FILE}.")
+            except Exception as e:
+                print(f"Could not write summaries back: {e}. Raw rows remain in {OUTPUT_FILE}.")
         else:
             print("\nScraping complete. No new jobs found.")
 
@@ -950,7 +1699,7 @@ def remove_csv_duplicates():
         return
 
     print(f"\n=== CLEANING TITLES & REMOVING DUPLICATES ===")
-    df = pd.read_csv(OUTPUT_FILE)
+    df = read_output_csv()
     original_count = len(df)
 
     # Ensure columns exist and fill NaNs